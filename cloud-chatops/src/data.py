@@ -5,10 +5,10 @@ This is preferred over dictionaries as dataclasses make code more readable.
 
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PR:
     """Class holding information about a single pull request."""
 
@@ -21,40 +21,43 @@ class PR:
     draft: bool
     stale: bool
     repository: str
-    labels: List[str]
+    labels: Tuple[str, ...]
 
     @classmethod
-    def from_json(cls, data: Dict):
+    def from_json(cls, data: Dict, now: Optional[datetime] = None):
         """
         Serialise the JSON data into this dataclass structure.
         :param data: JSON | Dict HTTP response data
+        :param now: The current time to check staleness against. Pass this in when creating many PRs.
         :return:
         """
-        created_at = datetime.strptime(data["created_at"], "%Y-%m-%dT%H:%M:%SZ")
+        created_at = datetime.fromisoformat(data["created_at"])
         return cls(
             title=f"{data['title']} #{data['number']}",
             author=data["user"]["login"],
             url=data["html_url"],
-            stale=cls.is_stale(created_at),
+            stale=cls.is_stale(created_at, now),
             created_at=created_at,
             draft=data["draft"],
-            labels=[label["name"] for label in data["labels"]],
+            labels=tuple(label["name"] for label in data["labels"]),
             repository=data["html_url"].split(sep="/")[5],
         )
 
     @staticmethod
-    def is_stale(created_at: datetime) -> bool:
+    def is_stale(created_at: datetime, now: Optional[datetime] = None) -> bool:
         """
         Returns if a PR is stale or not.
         :param created_at: When the PR was created
+        :param now: The current time. Defaults to now in the same timezone as created_at.
         """
+        if now is None:
+            now = datetime.now(created_at.tzinfo)
         opened_date = created_at.replace(tzinfo=None)
-        datetime_now = datetime.now().replace(tzinfo=None)
-        time_cutoff = datetime_now - timedelta(days=30)
+        time_cutoff = now.replace(tzinfo=None) - timedelta(days=30)
         return opened_date <= time_cutoff
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Ready to send message data"""
 
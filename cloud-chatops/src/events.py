@@ -3,22 +3,65 @@ This module contains events to run in main.py.
 """
 
 import os
-from typing import List
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Tuple
 import asyncio
 from slack_sdk import WebClient
 import schedule
 
-from data import User
+from data import User, PR
 from features.pr_reminder import PRReminder
 from find_prs import FindPRs
-from read_data import get_config, get_token
+from read_data import get_config, get_token, get_user_map
+
+# Seconds to reuse fetched PRs for, so events run in quick succession don't re-query GitHub.
+PR_CACHE_TTL = 60
+# Number of users to send personal reminders to at once. Kept low to respect Slack rate limits.
+REMINDER_WORKERS = 5
+# Longest time in seconds the scheduler sleeps for before checking for jobs again.
+MAX_SCHEDULE_SLEEP = 60
+_pr_cache: Dict[Tuple, Tuple[float, List[PR]]] = {}
+
+
+@lru_cache(maxsize=1)
+def _slack_client(token: str) -> WebClient:
+    """
+    Return a Slack client shared between events so its connections are reused.
+    A new client is only made if the token changes.
+    :param token: Slack bot token
+    :return: Slack client
+    """
+    return WebClient(token=token)
+
+
+def _fetch_prs(repos: Dict[str, List[str]]) -> List[PR]:
+    """
+    Find all open PRs in the given repositories sorted by creation date.
+    Recent results for the same repositories are reused.
+    :param repos: Dictionary of repository names and owners.
+    :return: List of PRs
+    """
+    key = tuple((owner, tuple(sorted(names))) for owner, names in sorted(repos.items()))
+    cached = _pr_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    finder = FindPRs()
+    try:
+        prs = finder.sort_by(finder.run(repos=repos), "created_at", False)
+    except Exception:
+        _pr_cache.pop(key, None)
+        raise
+    _pr_cache[key] = (time.monotonic() + PR_CACHE_TTL, prs)
+    return prs
 
 
 def run_global_reminder(channel: str) -> None:
     """This event sends a message to the specified channel with all open PRs."""
-    unsorted_prs = FindPRs().run(repos=get_config("repos"))
-    prs = FindPRs().sort_by(unsorted_prs, "created_at", False)
-    PRReminder(WebClient(token=get_token("SLACK_BOT_TOKEN"))).run(
+    prs = _fetch_prs(get_config("repos"))
+    PRReminder(_slack_client(get_token("SLACK_BOT_TOKEN"))).run(
         prs=prs,
         channel=channel,
     )
@@ -30,17 +73,24 @@ def run_personal_reminder(users: List[User], message_no_prs: bool = False) -> No
     :param message_no_prs: Send a message saying there are no PRs open.
     :param users: Users to send reminders to.
     """
-    unsorted_prs = FindPRs().run(repos=get_config("repos"))
-    prs = FindPRs().sort_by(unsorted_prs, "created_at", False)
-    client = WebClient(token=get_token("SLACK_BOT_TOKEN"))
-    for user in users:
-        filtered_prs = FindPRs().filter_by(prs, "author", user.github_name)
-        PRReminder(client).run(
-            prs=filtered_prs,
+    prs = _fetch_prs(get_config("repos"))
+    prs_by_author = defaultdict(list)
+    for pr in prs:
+        prs_by_author[pr.author].append(pr)
+
+    reminder = PRReminder(_slack_client(get_token("SLACK_BOT_TOKEN")))
+
+    def remind(user: User) -> None:
+        reminder.run(
+            prs=prs_by_author.get(user.github_name, []),
             channel=user.slack_id,
             message_no_prs=message_no_prs,
         )
 
+    # Each user has their own DM so the order the reminders are sent in doesn't matter.
+    with ThreadPoolExecutor(max_workers=REMINDER_WORKERS) as executor:
+        list(executor.map(remind, users))
+
 
 async def schedule_jobs() -> None:
     """
@@ -58,8 +108,13 @@ async def schedule_jobs() -> None:
     )
 
     while True:
-        schedule.run_pending()
-        await asyncio.sleep(10)
+        # Jobs make blocking HTTP requests so run them off the event loop thread.
+        await asyncio.to_thread(schedule.run_pending)
+        # Sleep until the next job is due rather than polling.
+        idle_seconds = schedule.idle_seconds()
+        if idle_seconds is None:
+            idle_seconds = MAX_SCHEDULE_SLEEP
+        await asyncio.sleep(min(max(idle_seconds, 1), MAX_SCHEDULE_SLEEP))
 
 
 async def slash_prs(ack, respond, command):
@@ -71,8 +126,8 @@ async def slash_prs(ack, respond, command):
     """
     await ack()
     user_id = command["user_id"]
-    users = get_config("users")
-    if user_id not in [user.slack_id for user in users]:
+    users = get_user_map()
+    if user_id not in users:
         await respond(
             f"Could not find your Slack ID {user_id} in the user map. "
             f"Please contact the service maintainer to fix this."
@@ -81,12 +136,12 @@ async def slash_prs(ack, respond, command):
 
     if command["text"] == "mine":
         await respond("Gathering the PRs...")
-        run_personal_reminder(
-            [user for user in users if user.slack_id == user_id], message_no_prs=True
+        await asyncio.to_thread(
+            run_personal_reminder, [users[user_id]], message_no_prs=True
         )
     elif command["text"] == "all":
         await respond("Gathering the PRs...")
-        run_global_reminder(user_id)
+        await asyncio.to_thread(run_global_reminder, user_id)
     else:
         await respond("Please provide the correct argument: 'mine' or 'all'.")
         return
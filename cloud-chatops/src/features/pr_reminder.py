@@ -1,6 +1,7 @@
 """This module sends reminders to direct messages and channels with open pull requests."""
 
-from typing import List
+from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
 from slack_sdk import WebClient
 from data import PR, Message
 from read_data import get_config
@@ -11,6 +12,8 @@ class PRReminder:
 
     def __init__(self, client: WebClient):
         self.client = client
+        self._real_names: Dict[str, str] = {}
+        self._author_lines: Dict[str, str] = {}
 
     def run(
         self,
@@ -82,7 +85,10 @@ class PRReminder:
         :param channel: Channel the message was sent to.
         :param reactions: Reactions to add.
         """
-        for react in reactions:
+        if not reactions:
+            return
+
+        def add_reaction(react: str) -> None:
             response = self.client.reactions_add(
                 channel=channel, name=react, timestamp=timestamp
             )
@@ -91,6 +97,10 @@ class PRReminder:
                     f'Reaction failed to add with error: {response["error"]}'
                 )
 
+        # Slack has no endpoint to add multiple reactions so send them at the same time.
+        with ThreadPoolExecutor(max_workers=min(len(reactions), 4)) as executor:
+            list(executor.map(add_reaction, reactions))
+
     def construct_messages(self, prs: List[PR]) -> List[Message]:
         """
         Constructs string messages and extracts needed reactions from the dataclass.
@@ -104,26 +114,43 @@ class PRReminder:
             messages.append(Message(text=string, reactions=reactions))
         return messages
 
-    @staticmethod
-    def make_string(pr: PR) -> str:
+    def get_real_name(self, github_name: str) -> str:
+        """
+        Returns the real name of a user from the user map.
+        The user map is only read once for the lifetime of this instance.
+        :param github_name: GitHub username of the user
+        :return: The real name or the GitHub username if the user isn't in the map
+        """
+        if not self._real_names:
+            self._real_names = {
+                user.github_name: user.real_name for user in get_config("users")
+            }
+        return self._real_names.get(github_name, github_name)
+
+    def get_author_line(self, github_name: str) -> str:
+        """
+        Returns the author line of a message. Lines are created once per author.
+        :param github_name: GitHub username of the author
+        :return: The author line
+        """
+        if github_name not in self._author_lines:
+            self._author_lines[github_name] = (
+                f"Author: {self.get_real_name(github_name)}"
+            )
+        return self._author_lines[github_name]
+
+    def make_string(self, pr: PR) -> str:
         """
         Creates string from PR data.
         :param pr: PR data
         :return: String message
         """
-        message = []
-        real_name = ""
-        for user in get_config("users"):
-            if user.github_name == pr.author:
-                real_name = user.real_name
-        if not real_name:
-            real_name = pr.author
-
+        message = (
+            f"Pull Request: <{pr.url}|{pr.title}>\n{self.get_author_line(pr.author)}"
+        )
         if pr.stale:
-            message.append("*This PR is older than 30 days. Consider closing it:*")
-        message.append(f"Pull Request: <{pr.url}|{pr.title}>")
-        message.append(f"Author: {real_name}")
-        return "\n".join(message)
+            return "*This PR is older than 30 days. Consider closing it:*\n" + message
+        return message
 
     @staticmethod
     def get_reactions(pr: PR) -> List[str]:
@@ -1,10 +1,19 @@
 """This module finds all open pull requests from given repositories."""
 
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import List, Dict, Tuple
 import requests
 from read_data import get_token
 from data import PR
 
+# Number of repositories to request PRs from at once.
+REQUEST_WORKERS = 8
+# The last ETag and PRs returned for each URL.
+# GitHub doesn't count conditional requests which return 304 Not Modified against the rate limit.
+_etag_cache: Dict[str, Tuple[str, List[Dict]]] = {}
+
 
 class FindPRs:
     """This class finds all open pull requests in the given repositories. It can also sort them by property."""
@@ -31,7 +40,8 @@ class FindPRs:
                 organisation, repos.get(organisation)
             )
 
-        return [PR.from_json(response) for response in raw_responses]
+        now = datetime.now(timezone.utc)
+        return [PR.from_json(response, now) for response in raw_responses]
 
     def request_all_repos(
         self, organisation: str, repositories: List[str]
@@ -42,24 +52,41 @@ class FindPRs:
         :param repositories: List of repository names
         :return: A list of PRs stored as dictionaries
         """
+        urls = [
+            f"https://api.github.com/repos/{organisation}/{repo}/pulls"
+            for repo in repositories
+        ]
+        if not urls:
+            return []
         responses = []
-        for repo in repositories:
-            url = f"https://api.github.com/repos/{organisation}/{repo}/pulls"
-            responses += self.make_request(url)
+        with ThreadPoolExecutor(
+            max_workers=min(len(urls), REQUEST_WORKERS)
+        ) as executor:
+            for response in executor.map(self.make_request, urls):
+                responses += response
         return responses
 
     def make_request(self, url: str) -> List[Dict]:
         """
         Send an HTTP request to the GitHub Rest API endpoint and return all open PRs.
+        If the PRs haven't changed since the last request to this URL the previous PRs are returned.
         :param url: The URL to make the request to
         :return: List of PRs in dict / json
         """
         headers = {"Authorization": "token " + self.github_token}
+        cached = _etag_cache.get(url)
+        if cached:
+            headers["If-None-Match"] = cached[0]
         response = requests.get(url, headers=headers, timeout=60)
+        if cached and response.status_code == 304:
+            return cached[1]
         response.raise_for_status()
-        return (
-            [response.json()] if isinstance(response.json(), dict) else response.json()
-        )
+        data = response.json()
+        prs = [data] if isinstance(data, dict) else data
+        etag = response.headers.get("ETag")
+        if etag:
+            _etag_cache[url] = (etag, prs)
+        return prs
 
     @staticmethod
     def sort_by(obj_list: List[PR], prop: str, reverse: bool = False) -> List[PR]:
@@ -71,7 +98,7 @@ class FindPRs:
         :return: List of PRs
         """
         try:
-            return sorted(obj_list, key=lambda pr: getattr(pr, prop), reverse=reverse)
+            return sorted(obj_list, key=attrgetter(prop), reverse=reverse)
         except AttributeError as exc:
             raise ValueError(f"Unable to sort list by {prop}") from exc
 
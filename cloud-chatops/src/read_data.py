@@ -1,12 +1,20 @@
 """This module handles reading data from files such as secrets and user maps."""
 
-from typing import Dict, Union, List
+from typing import Dict, Union, List, Tuple
+from functools import lru_cache
+import logging
 import sys
 import os
 import yaml
 from errors import ErrorInConfig
 from data import User
 
+try:
+    # Use the libyaml C parser when PyYAML was built with it, as it is much faster.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def get_path() -> str:
     """
@@ -33,16 +41,79 @@ def get_path() -> str:
     return "/usr/src/app/cloud_chatops/"
 
 
+@lru_cache(maxsize=4)
+def _parse_yaml(path: str, modified: float) -> Dict:
+    """
+    Parse a YAML file. Results are cached per path and modification time.
+    :param path: Path to the YAML file
+    :param modified: Modification time of the file, used to invalidate the cache
+    :return: The parsed file contents
+    """
+    # modified is only used as part of the cache key
+    # pylint: disable=W0613
+    with open(path, "r", encoding="utf-8") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def _load_yaml(path: str) -> Dict:
+    """
+    Return the contents of a YAML file, only re-reading it from disk if it has changed.
+    :param path: Path to the YAML file
+    :return: The parsed file contents
+    """
+    return _parse_yaml(path, os.stat(path).st_mtime)
+
+
+def _dedupe_repos(repos: Dict[str, List[str]]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Remove duplicate repositories from each organisation so they are only requested once.
+    :param repos: Dictionary of repository owners and names from the config
+    :return: Dictionary of repository owners and tuples of unique names, in their original order
+    """
+    deduped = {}
+    for organisation, names in repos.items():
+        deduped[organisation] = tuple(dict.fromkeys(names or []))
+        if len(deduped[organisation]) != len(names or []):
+            logging.warning(
+                "Removed duplicate repositories for %s in config.yml.", organisation
+            )
+    return deduped
+
+
+@lru_cache(maxsize=4)
+def _parse_config(path: str, modified: float) -> Dict:
+    """
+    Parse the config file and prepare each section for use. Results are cached per path and modification time.
+    :param path: Path to the config file
+    :param modified: Modification time of the file, used to invalidate the cache
+    :return: The config sections and the users keyed by Slack ID
+    """
+    config_data = _parse_yaml(path, modified)
+    users = [User.from_config(user) for user in config_data.get("users") or []]
+    return {
+        "users": users,
+        "repos": _dedupe_repos(config_data.get("repos") or {}),
+        "channel": config_data.get("channel"),
+        "user_map": {user.slack_id: user for user in users},
+    }
+
+
+def _load_config() -> Dict:
+    """
+    Return the prepared config, only re-reading the config file if it has changed.
+    :return: The config sections and the users keyed by Slack ID
+    """
+    path = get_path() + "config/config.yml"
+    return _parse_config(path, os.stat(path).st_mtime)
+
+
 def get_token(secret: str) -> str:
     """
     This function reads from the secret's file and returns a specified secret.
     :param secret: The secret to find
     :return: A secret as string
     """
-    path = get_path()
-    with open(path + "secrets/secrets.yml", "r", encoding="utf-8") as secrets:
-        secrets_data = yaml.safe_load(secrets)
-        return secrets_data[secret]
+    return _load_yaml(get_path() + "secrets/secrets.yml")[secret]
 
 
 def get_config(section: str) -> Union[List | Dict]:
@@ -51,33 +122,35 @@ def get_config(section: str) -> Union[List | Dict]:
     :param section: The section of the config to retrieve.
     :return: The data retrieved from the config file.
     """
-    path = get_path()
-    with open(path + "config/config.yml", "r", encoding="utf-8") as config:
-        config_data = yaml.safe_load(config)
-        match section:
-            case "users":
-                return [User.from_config(user) for user in config_data[section]]
-            case "repos":
-                return config_data[section]
-            case "channel":
-                return config_data[section]
-            case _:
-                raise KeyError(f"No section in config named {section}.")
+    if section not in ["users", "repos", "channel"]:
+        raise KeyError(f"No section in config named {section}.")
+    return _load_config()[section]
+
+
+def get_user_map() -> Dict[str, User]:
+    """
+    This function returns the users from the config file keyed by their Slack ID.
+    :return: Dictionary of Slack IDs to users
+    """
+    return _load_config()["user_map"]
 
 
 def validate_required_files() -> None:
     """
     This function checks that all required files have data in them before the app runs.
+    Each file is read once, which also warms the caches for later calls.
     """
+    secrets_data = _load_yaml(get_path() + "secrets/secrets.yml")
     for token in ["SLACK_BOT_TOKEN", "SLACK_APP_TOKEN", "GITHUB_TOKEN"]:
-        if not get_token(token):
+        if not secrets_data.get(token):
             raise ErrorInConfig(f"Token {token} does not have a value in secrets.yml.")
 
-    if not get_config("repos"):
+    config_data = _load_config()
+    if not config_data["repos"]:
         raise ErrorInConfig("config.yml does not contain any repositories.")
 
-    if not get_config("users"):
+    if not config_data["users"]:
         raise ErrorInConfig("Users parameter in config.yml is not set.")
 
-    if not get_config("channel"):
+    if not config_data["channel"]:
         raise ErrorInConfig("Channel parameter in config.yml is not set.")
@@ -1,6 +1,8 @@
 """Tests for data.py"""
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timedelta
+import pytest
 from data import PR, User
 
 # pylint: disable=R0801
@@ -22,9 +24,9 @@ MOCK_PR = PR(
     url="https://api.github.com/repos/mock_owner/mock_repo/pulls",
     stale=True,
     draft=False,
-    labels=["mock_label"],
+    labels=("mock_label",),
     repository="mock_repo",
-    created_at=datetime.strptime("2024-11-15T07:33:56Z", "%Y-%m-%dT%H:%M:%SZ"),
+    created_at=datetime.fromisoformat("2024-11-15T07:33:56Z"),
 )
 
 MOCK_USER = User(
@@ -44,9 +46,26 @@ def test_is_stale_true():
     assert PR.is_stale(datetime.now() - timedelta(days=30))
 
 
+def test_is_stale_now():
+    """Test that is_stale compares against the given time."""
+    created_at = datetime.fromisoformat("2024-11-15T07:33:56Z")
+    assert not PR.is_stale(created_at, created_at + timedelta(days=29))
+    assert PR.is_stale(created_at, created_at + timedelta(days=30))
+
+
 def test_from_json():
     """Test that the JSON | Dict data is correctly serialised into a dataclass."""
     assert MOCK_PR == PR.from_json(MOCK_DATA)
+    assert not PR.from_json(
+        MOCK_DATA, datetime.fromisoformat("2024-11-16T00:00:00Z")
+    ).stale
+
+
+def test_pr_frozen():
+    """Test that PRs can't be changed and can be hashed."""
+    with pytest.raises(FrozenInstanceError):
+        MOCK_PR.stale = False
+    assert {MOCK_PR, PR.from_json(MOCK_DATA)} == {MOCK_PR}
 
 
 def test_from_config():
@@ -1,10 +1,13 @@
 """Unit tests for events.py"""
 
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, NonCallableMock
 import pytest
 
 from data import User
 from events import (
+    _fetch_prs,
+    _pr_cache,
+    _slack_client,
     run_global_reminder,
     run_personal_reminder,
     schedule_jobs,
@@ -17,6 +20,57 @@ MOCK_USER = User(
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Make sure PRs and clients made in one test are not reused in another."""
+    _pr_cache.clear()
+    _slack_client.cache_clear()
+
+
+@patch("events.WebClient")
+def test_slack_client(mock_web_client):
+    """Test the client is reused until the token changes."""
+    assert _slack_client("mock_token") == _slack_client("mock_token")
+    mock_web_client.assert_called_once_with(token="mock_token")
+    _slack_client("mock_token_2")
+    mock_web_client.assert_called_with(token="mock_token_2")
+
+
+@patch("events.FindPRs")
+def test_fetch_prs_cached(mock_find_prs):
+    """Test PRs are only fetched once for the same repositories in quick succession."""
+    res = _fetch_prs({"owner1": ["repo1", "repo2"], "owner2": ["repo3"]})
+    res_2 = _fetch_prs({"owner2": ["repo3"], "owner1": ["repo2", "repo1"]})
+    mock_find_prs.return_value.run.assert_called_once_with(
+        repos={"owner1": ["repo1", "repo2"], "owner2": ["repo3"]}
+    )
+    mock_find_prs.assert_called_once_with()
+    mock_find_prs.return_value.sort_by.assert_called_once_with(
+        mock_find_prs.return_value.run.return_value, "created_at", False
+    )
+    assert res == res_2 == mock_find_prs.return_value.sort_by.return_value
+
+
+@patch("events.time")
+@patch("events.FindPRs")
+def test_fetch_prs_expired(mock_find_prs, mock_time):
+    """Test PRs are fetched again once the cached results have expired."""
+    mock_time.monotonic.side_effect = [0, 1000, 1000]
+    _fetch_prs({"owner1": ["repo1"]})
+    _fetch_prs({"owner1": ["repo1"]})
+    assert mock_find_prs.return_value.run.call_count == 2
+
+
+@patch("events.FindPRs")
+def test_fetch_prs_fails(mock_find_prs):
+    """Test nothing is cached if fetching the PRs fails."""
+    mock_find_prs.return_value.run.side_effect = [RuntimeError, ["mock_pr"]]
+    with pytest.raises(RuntimeError):
+        _fetch_prs({"owner1": ["repo1"]})
+    _fetch_prs({"owner1": ["repo1"]})
+    assert mock_find_prs.return_value.run.call_count == 2
+
+
 @patch("events.WebClient")
 @patch("events.get_token")
 @patch("events.get_config")
@@ -52,25 +106,53 @@ def test_run_personal_reminder(
     """Test personal reminder event"""
     mock_repos = {"mock_owner": ["mock_repo"]}
     mock_get_config.side_effect = [mock_repos]
+    mock_pr = NonCallableMock(author="mock_github")
+    mock_pr_other = NonCallableMock(author="mock_github_other")
+    mock_find_prs.return_value.sort_by.return_value = [mock_pr, mock_pr_other]
     run_personal_reminder([MOCK_USER])
     mock_find_prs.return_value.run.assert_called_once_with(repos=mock_repos)
     mock_find_prs.return_value.sort_by.assert_called_once_with(
         mock_find_prs.return_value.run.return_value, "created_at", False
     )
-    mock_find_prs.return_value.filter_by.assert_called_once_with(
-        mock_find_prs.return_value.sort_by.return_value, "author", "mock_github"
-    )
     mock_get_config.assert_any_call("repos")
     mock_web_client.assert_called_once_with(token=mock_get_token.return_value)
     mock_get_token.assert_called_once_with("SLACK_BOT_TOKEN")
     mock_pr_reminder.assert_called_once_with(mock_web_client.return_value)
     mock_pr_reminder.return_value.run.assert_called_once_with(
-        prs=mock_find_prs.return_value.filter_by.return_value,
+        prs=[mock_pr],
         channel="mock_slack",
         message_no_prs=False,
     )
 
 
+@patch("events.WebClient")
+@patch("events.get_token")
+@patch("events.get_config")
+@patch("events.FindPRs")
+@patch("events.PRReminder")
+def test_run_personal_reminder_many_users(
+    mock_pr_reminder, mock_find_prs, mock_get_config, _, __
+):
+    """Test each user is sent their own reminder and errors are raised."""
+    mock_get_config.return_value = {"mock_owner": ["mock_repo"]}
+    mock_user_2 = User(
+        real_name="mock user 2", github_name="mock_github_2", slack_id="mock_slack_2"
+    )
+    mock_pr = NonCallableMock(author="mock_github_2")
+    mock_find_prs.return_value.sort_by.return_value = [mock_pr]
+    run_personal_reminder([MOCK_USER, mock_user_2], message_no_prs=True)
+    mock_pr_reminder.return_value.run.assert_any_call(
+        prs=[], channel="mock_slack", message_no_prs=True
+    )
+    mock_pr_reminder.return_value.run.assert_any_call(
+        prs=[mock_pr], channel="mock_slack_2", message_no_prs=True
+    )
+
+    mock_pr_reminder.return_value.run.side_effect = RuntimeError
+    with pytest.raises(RuntimeError):
+        run_personal_reminder([MOCK_USER, mock_user_2])
+
+
 @pytest.mark.asyncio
 @patch("events.schedule")
 @patch("events.get_config")
@@ -99,17 +181,38 @@ async def test_schedule_jobs(mock_get_config, mock_schedule):
 
 
 @pytest.mark.asyncio
-@patch("events.run_personal_reminder")
+@pytest.mark.parametrize(
+    "idle_seconds, expected", [(None, 60), (-5, 1), (0.5, 1), (30, 30), (3600, 60)]
+)
+@patch("events.asyncio")
+@patch("events.schedule")
 @patch("events.get_config")
-async def test_slash_prs_mine(mock_get_config, mock_run_personal):
+async def test_schedule_jobs_sleep(
+    _, mock_schedule, mock_asyncio, idle_seconds, expected
+):
+    """Test the scheduler sleeps until the next job is due, for no longer than a minute."""
+    mock_schedule.idle_seconds.return_value = idle_seconds
+    mock_asyncio.to_thread = AsyncMock()
+    # Break out of the infinite loop on the first sleep
+    mock_asyncio.sleep.side_effect = Exception()
+    with pytest.raises(Exception):
+        await schedule_jobs()
+    mock_asyncio.to_thread.assert_awaited_once_with(mock_schedule.run_pending)
+    mock_asyncio.sleep.assert_called_once_with(expected)
+
+
+@pytest.mark.asyncio
+@patch("events.run_personal_reminder")
+@patch("events.get_user_map")
+async def test_slash_prs_mine(mock_get_user_map, mock_run_personal):
     """Test the function works when users choose mine"""
-    mock_get_config.return_value = [MOCK_USER]
+    mock_get_user_map.return_value = {"mock_slack": MOCK_USER}
     mock_respond = AsyncMock()
     mock_command = {"user_id": "mock_slack", "text": "mine"}
     mock_ack = AsyncMock()
     await slash_prs(mock_ack, mock_respond, mock_command)
     mock_ack.assert_called_once_with()
-    mock_get_config.assert_called_once_with("users")
+    mock_get_user_map.assert_called_once_with()
     mock_respond.assert_any_call("Gathering the PRs...")
     mock_respond.assert_any_call("Check out your DMs.")
     mock_run_personal.assert_called_once_with([MOCK_USER], message_no_prs=True)
@@ -117,48 +220,48 @@ async def test_slash_prs_mine(mock_get_config, mock_run_personal):
 
 @pytest.mark.asyncio
 @patch("events.run_global_reminder")
-@patch("events.get_config")
-async def test_slash_prs_all(mock_get_config, mock_run_global):
+@patch("events.get_user_map")
+async def test_slash_prs_all(mock_get_user_map, mock_run_global):
     """Test the function works when users choose all"""
-    mock_get_config.return_value = [MOCK_USER]
+    mock_get_user_map.return_value = {"mock_slack": MOCK_USER}
     mock_respond = AsyncMock()
     mock_command = {"user_id": "mock_slack", "text": "all"}
     mock_ack = AsyncMock()
     await slash_prs(mock_ack, mock_respond, mock_command)
     mock_ack.assert_called_once_with()
-    mock_get_config.assert_called_once_with("users")
+    mock_get_user_map.assert_called_once_with()
     mock_respond.assert_any_call("Gathering the PRs...")
     mock_respond.assert_any_call("Check out your DMs.")
     mock_run_global.assert_called_once_with("mock_slack")
 
 
 @pytest.mark.asyncio
-@patch("events.get_config")
-async def test_slash_prs_fail(mock_get_config):
+@patch("events.get_user_map")
+async def test_slash_prs_fail(mock_get_user_map):
     """Test the function fails if no option is given"""
-    mock_get_config.return_value = [MOCK_USER]
+    mock_get_user_map.return_value = {"mock_slack": MOCK_USER}
     mock_respond = AsyncMock()
     mock_command = {"user_id": "mock_slack", "text": ""}
     mock_ack = AsyncMock()
     await slash_prs(mock_ack, mock_respond, mock_command)
     mock_ack.assert_called_once_with()
-    mock_get_config.assert_called_once_with("users")
+    mock_get_user_map.assert_called_once_with()
     mock_respond.assert_any_call(
         "Please provide the correct argument: 'mine' or 'all'."
     )
 
 
 @pytest.mark.asyncio
-@patch("events.get_config")
-async def test_slash_prs_no_user(mock_get_config):
+@patch("events.get_user_map")
+async def test_slash_prs_no_user(mock_get_user_map):
     """Test the function fails if the user is not found in the config file"""
-    mock_get_config.return_value = [MOCK_USER]
+    mock_get_user_map.return_value = {"mock_slack": MOCK_USER}
     mock_respond = AsyncMock()
     mock_command = {"user_id": "non_existent_user", "text": ""}
     mock_ack = AsyncMock()
     await slash_prs(mock_ack, mock_respond, mock_command)
     mock_ack.assert_called_once_with()
-    mock_get_config.assert_called_once_with("users")
+    mock_get_user_map.assert_called_once_with()
     mock_respond.assert_any_call(
         "Could not find your Slack ID non_existent_user in the user map. "
         "Please contact the service maintainer to fix this."
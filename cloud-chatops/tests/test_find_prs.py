@@ -4,7 +4,7 @@ from unittest.mock import patch, NonCallableMock
 from datetime import datetime
 import pytest
 from requests.exceptions import HTTPError
-from find_prs import FindPRs
+from find_prs import FindPRs, _etag_cache
 from data import PR
 
 
@@ -17,6 +17,12 @@ def instance_fixture():
     return FindPRs()
 
 
+@pytest.fixture(autouse=True)
+def clear_etag_cache():
+    """Make sure responses cached in one test are not reused in another."""
+    _etag_cache.clear()
+
+
 @patch("find_prs.PR")
 @patch("find_prs.get_token")
 @patch("find_prs.FindPRs.request_all_repos")
@@ -42,7 +48,11 @@ def test_run(mock_request_all_repos, mock_get_token, mock_data, instance):
 @patch("find_prs.FindPRs.make_request")
 def test_request_all_repos(mock_make_request, instance):
     """Test a request is made for each repo in the list"""
-    mock_make_request.side_effect = [["mock_response_1"], ["mock_response_2"]]
+    # Requests are made concurrently so return responses by URL rather than call order
+    mock_make_request.side_effect = {
+        "https://api.github.com/repos/mock_owner/mock_repo_1/pulls": ["mock_response_1"],
+        "https://api.github.com/repos/mock_owner/mock_repo_2/pulls": ["mock_response_2"],
+    }.get
     res = instance.request_all_repos("mock_owner", ["mock_repo_1", "mock_repo_2"])
     mock_make_request.assert_any_call(
         "https://api.github.com/repos/mock_owner/mock_repo_1/pulls"
@@ -53,6 +63,13 @@ def test_request_all_repos(mock_make_request, instance):
     assert res == ["mock_response_1", "mock_response_2"]
 
 
+@patch("find_prs.FindPRs.make_request")
+def test_request_all_repos_none(mock_make_request, instance):
+    """Test no requests are made if there are no repos"""
+    assert instance.request_all_repos("mock_owner", []) == []
+    mock_make_request.assert_not_called()
+
+
 @patch("find_prs.requests")
 def test_make_request(mock_requests, instance):
     """Test that requests are made and errors are raised."""
@@ -70,15 +87,35 @@ def test_make_request(mock_requests, instance):
         )
 
 
+@patch("find_prs.requests")
+def test_make_request_not_modified(mock_requests, instance):
+    """Test the previous PRs are returned when GitHub responds with 304 Not Modified."""
+    mock_ok_request = NonCallableMock(status_code=200, headers={"ETag": "mock_etag"})
+    mock_ok_request.json.return_value = [{"mock": "pr"}]
+    mock_not_modified_request = NonCallableMock(status_code=304)
+    mock_requests.get.side_effect = [mock_ok_request, mock_not_modified_request]
+    url = "https://api.github.com/repos/mock_owner/mock_repo/pulls"
+    instance.github_token = "mock_token"
+    res = instance.make_request(url)
+    res_2 = instance.make_request(url)
+    mock_requests.get.assert_called_with(
+        url,
+        headers={"Authorization": "token mock_token", "If-None-Match": "mock_etag"},
+        timeout=60,
+    )
+    mock_not_modified_request.raise_for_status.assert_not_called()
+    assert res == res_2 == [{"mock": "pr"}]
+
+
 MOCK_PR_1 = PR(
     title="mock_title #1",
     author="mock_author",
     url="https://api.github.com/repos/mock_owner/mock_repo/pulls",
     stale=False,
     draft=False,
-    labels=["mock_label"],
+    labels=("mock_label",),
     repository="mock_repo",
-    created_at=datetime.strptime("2024-11-15T07:33:56Z", "%Y-%m-%dT%H:%M:%SZ"),
+    created_at=datetime.fromisoformat("2024-11-15T07:33:56Z"),
 )
 MOCK_PR_2 = PR(
     title="mock_title #2",
@@ -86,9 +123,9 @@ MOCK_PR_2 = PR(
     url="https://api.github.com/repos/mock_owner/mock_repo/pulls",
     stale=True,
     draft=True,
-    labels=["mock_label"],
+    labels=("mock_label",),
     repository="mock_repo_2",
-    created_at=datetime.strptime("2024-10-15T07:33:56Z", "%Y-%m-%dT%H:%M:%SZ"),
+    created_at=datetime.fromisoformat("2024-10-15T07:33:56Z"),
 )
 
 
@@ -23,9 +23,9 @@ MOCK_PR = PR(
     url="https://api.github.com/repos/mock_owner/mock_repo/pulls",
     stale=True,
     draft=True,
-    labels=["mock_label"],
+    labels=("mock_label",),
     repository="mock_repo",
-    created_at=datetime.strptime("2024-11-15T07:33:56Z", "%Y-%m-%dT%H:%M:%SZ"),
+    created_at=datetime.fromisoformat("2024-11-15T07:33:56Z"),
 )
 
 MOCK_PR_2 = PR(
@@ -34,9 +34,9 @@ MOCK_PR_2 = PR(
     url="https://api.github.com/repos/mock_owner/mock_repo/pulls",
     stale=True,
     draft=True,
-    labels=["mock_label"],
+    labels=("mock_label",),
     repository="mock_repo",
-    created_at=datetime.strptime("2024-11-15T07:33:56Z", "%Y-%m-%dT%H:%M:%SZ"),
+    created_at=datetime.fromisoformat("2024-11-15T07:33:56Z"),
 )
 
 MOCK_USER = User(
@@ -62,6 +62,7 @@ def test_make_string(mock_get_config, instance):
     """Test the right string is returned."""
     mock_get_config.return_value = [MOCK_USER]
     res = instance.make_string(MOCK_PR)
+    instance.make_string(MOCK_PR_2)
     mock_get_config.assert_called_once_with("users")
     expected = (
         f"*This PR is older than 30 days. Consider closing it:*"
@@ -82,6 +83,32 @@ def test_make_string_fails(mock_get_config, instance):
     assert res == expected
 
 
+@patch("features.pr_reminder.get_config")
+def test_get_real_name(mock_get_config, instance):
+    """Test the real name is returned and the user map is only read once."""
+    mock_get_config.return_value = [MOCK_USER]
+    assert instance.get_real_name("mock_github") == "mock user"
+    assert instance.get_real_name("mock_github_2") == "mock_github_2"
+    mock_get_config.assert_called_once_with("users")
+
+
+@patch("features.pr_reminder.PRReminder.get_real_name")
+def test_get_author_line(mock_get_real_name, instance):
+    """Test the author line is only created once per author."""
+    mock_get_real_name.return_value = "mock user"
+    assert instance.get_author_line("mock_github") == "Author: mock user"
+    assert instance.get_author_line("mock_github") == "Author: mock user"
+    mock_get_real_name.assert_called_once_with("mock_github")
+
+
+@patch("features.pr_reminder.get_config")
+def test_make_string_not_stale(mock_get_config, instance):
+    """Test the stale header is left out for PRs that aren't stale."""
+    mock_get_config.return_value = [MOCK_USER]
+    res = instance.make_string(replace(MOCK_PR, stale=False))
+    assert res == f"Pull Request: <{MOCK_PR.url}|{MOCK_PR.title}>\nAuthor: mock user"
+
+
 @patch("features.pr_reminder.PRReminder.make_string")
 @patch("features.pr_reminder.PRReminder.get_reactions")
 def test_construct_messages(mock_get_reactions, mock_make_string, instance):
@@ -101,6 +128,19 @@ def test_add_reactions(instance):
     )
 
 
+def test_add_reactions_many(instance):
+    """Test a reaction add call is made for every reaction."""
+    instance.client.reactions_add.return_value = {"ok": True}
+    instance.add_reactions(
+        "mock_timestamp", "mock_channel", ["mock_reaction", "mock_reaction_2"]
+    )
+    for reaction in ["mock_reaction", "mock_reaction_2"]:
+        instance.client.reactions_add.assert_any_call(
+            channel="mock_channel", name=reaction, timestamp="mock_timestamp"
+        )
+    assert instance.client.reactions_add.call_count == 2
+
+
 def test_add_reactions_fails(instance):
     """Test reaction add calls are made and fail."""
     instance.client.reactions_add.return_value = {"ok": False, "error": "mock_error"}
@@ -1,10 +1,18 @@
 """This test file covers all tests for the read_data module."""
 
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, mock_open, NonCallableMock
 import pytest
 from data import User
 from errors import ErrorInConfig
-from read_data import get_token, get_config, validate_required_files, get_path
+from read_data import (
+    get_token,
+    get_config,
+    validate_required_files,
+    get_path,
+    get_user_map,
+    _parse_yaml,
+    _parse_config,
+)
 
 MOCK_CONFIG = """
 ---
@@ -27,6 +35,16 @@ MOCK_USER = User(
 )
 
 
+@pytest.fixture(name="mock_stat", autouse=True)
+def mock_stat_fixture():
+    """Clear the file caches and mock the file modification time for each test."""
+    _parse_yaml.cache_clear()
+    _parse_config.cache_clear()
+    with patch("read_data.os.stat") as mock_stat:
+        mock_stat.return_value = NonCallableMock(st_mtime=1.0)
+        yield mock_stat
+
+
 def test_get_path_prod():
     """Test the production path is returned"""
     assert get_path() == "/usr/src/app/cloud_chatops/"
@@ -87,11 +105,24 @@ def test_get_config_repos():
     with patch("builtins.open", mock_open(read_data=MOCK_CONFIG)):
         res = get_config("repos")
         assert res == {
-            "organisation1": ["repo1", "repo2"],
-            "organisation2": ["repo1", "repo2"],
+            "organisation1": ("repo1", "repo2"),
+            "organisation2": ("repo1", "repo2"),
         }
 
 
+def test_get_config_repos_duplicates(caplog):
+    """Test duplicate repos are removed from the config and a warning is logged."""
+    mock_config = MOCK_CONFIG.replace("    - repo2\n", "    - repo2\n    - repo1\n", 1)
+    with patch("builtins.open", mock_open(read_data=mock_config)):
+        res = get_config("repos")
+        assert res == {
+            "organisation1": ("repo1", "repo2"),
+            "organisation2": ("repo1", "repo2"),
+        }
+        assert get_config("repos") is res
+    assert "organisation1" in caplog.text
+
+
 def test_get_config_channel():
     """Tests that the channel is returned from the config."""
     with patch("builtins.open", mock_open(read_data=MOCK_CONFIG)):
@@ -99,6 +130,26 @@ def test_get_config_channel():
         assert res == "mock_channel"
 
 
+def test_get_config_cached(mock_stat):
+    """Test the config file is only read again once it has been modified."""
+    with patch("builtins.open", mock_open(read_data=MOCK_CONFIG)) as mock_file:
+        get_config("users")
+        get_config("repos")
+        assert get_config("channel") == "mock_channel"
+        mock_file.assert_called_once()
+        mock_stat.return_value = NonCallableMock(st_mtime=2.0)
+        assert get_config("users") == [MOCK_USER]
+        assert mock_file.call_count == 2
+
+
+def test_get_user_map():
+    """Test the users are returned keyed by their Slack ID."""
+    with patch("builtins.open", mock_open(read_data=MOCK_CONFIG)):
+        res = get_user_map()
+        assert res == {"mock_slack": MOCK_USER}
+        assert get_user_map() is res
+
+
 def test_get_config_fails():
     """This test checks that an error is raised when accessing a part of the config that doesn't exist."""
     with patch("builtins.open", mock_open(read_data=MOCK_CONFIG)):
@@ -106,58 +157,89 @@ def test_get_config_fails():
             get_config("unknown")
 
 
-@patch("read_data.get_config")
-@patch("read_data.get_token")
-def test_validate_required_files(mock_get_token, mock_get_config):
+MOCK_SECRETS = {
+    "SLACK_BOT_TOKEN": "mock_bot",
+    "SLACK_APP_TOKEN": "mock_app",
+    "GITHUB_TOKEN": "mock_github",
+}
+
+MOCK_CONFIG_DATA = {
+    "repos": {"owner1": ["repo1"]},
+    "users": [MOCK_USER],
+    "channel": "mock_channel",
+}
+
+
+@patch("read_data._load_config")
+@patch("read_data._load_yaml")
+def test_validate_required_files(mock_load_yaml, mock_load_config):
     """Test the validate files function"""
-    mock_get_token.side_effect = ["mock_bot", "mock_app", "mock_github"]
-    mock_get_config.side_effect = [
-        {"owner1": ["repo1"]},
-        {"github1": "slack1"},
-        "mock_channel",
-    ]
+    mock_load_yaml.return_value = MOCK_SECRETS
+    mock_load_config.return_value = MOCK_CONFIG_DATA
     validate_required_files()
+    mock_load_yaml.assert_called_once_with(
+        "/usr/src/app/cloud_chatops/secrets/secrets.yml"
+    )
+    mock_load_config.assert_called_once_with()
+
+
+def test_validate_required_files_reads_once(mock_stat):
+    """Test each file is only read once when validating."""
+    # Both files are read from the same mock so it holds the secrets and the config
+    mock_data = MOCK_CONFIG + "".join(f"{k}: {v}\n" for k, v in MOCK_SECRETS.items())
+    with patch("builtins.open", mock_open(read_data=mock_data)) as mock_file:
+        mock_stat.side_effect = [
+            NonCallableMock(st_mtime=1.0),
+            NonCallableMock(st_mtime=2.0),
+        ]
+        validate_required_files()
+        assert mock_file.call_count == 2
+
+
+@patch("read_data._load_config")
+@patch("read_data._load_yaml")
+def test_validate_required_files_fail_repo(mock_load_yaml, mock_load_config):
+    """Test the validate files function"""
+    mock_load_yaml.return_value = MOCK_SECRETS
+    mock_load_config.return_value = {**MOCK_CONFIG_DATA, "repos": {}}
+    with pytest.raises(ErrorInConfig):
+        validate_required_files()
 
 
-@patch("read_data.get_config")
-@patch("read_data.get_token")
-def test_validate_required_files_fail_repo(mock_get_token, mock_get_config):
+@patch("read_data._load_config")
+@patch("read_data._load_yaml")
+def test_validate_required_files_fail_token(mock_load_yaml, mock_load_config):
     """Test the validate files function"""
-    mock_get_token.side_effect = ["mock_bot", "mock_app", "mock_github"]
-    mock_get_config.side_effect = [{}, {"github1": "slack1"}]
+    mock_load_yaml.return_value = {**MOCK_SECRETS, "SLACK_BOT_TOKEN": ""}
     with pytest.raises(ErrorInConfig):
         validate_required_files()
+    mock_load_config.assert_not_called()
 
 
-@patch("read_data.get_config")
-@patch("read_data.get_token")
-def test_validate_required_files_fail_token(mock_get_token, mock_get_config):
+@patch("read_data._load_config")
+@patch("read_data._load_yaml")
+def test_validate_required_files_missing_token(mock_load_yaml, _):
     """Test the validate files function"""
-    mock_get_token.side_effect = ["", "mock_app", "mock_github"]
-    mock_get_config.side_effect = [{"owner1": ["repo1"]}, {"github1": "slack1"}]
+    mock_load_yaml.return_value = {"SLACK_BOT_TOKEN": "mock_bot"}
     with pytest.raises(ErrorInConfig):
         validate_required_files()
 
 
-@patch("read_data.get_config")
-@patch("read_data.get_token")
-def test_validate_required_files_fail_users(mock_get_token, mock_get_config):
+@patch("read_data._load_config")
+@patch("read_data._load_yaml")
+def test_validate_required_files_fail_users(mock_load_yaml, mock_load_config):
     """Test the validate files function"""
-    mock_get_token.side_effect = ["mock_bot", "mock_app", "mock_github"]
-    mock_get_config.side_effect = [{"owner1": ["repo1"]}, {}]
+    mock_load_yaml.return_value = MOCK_SECRETS
+    mock_load_config.return_value = {**MOCK_CONFIG_DATA, "users": []}
     with pytest.raises(ErrorInConfig):
         validate_required_files()
 
 
-@patch("read_data.get_config")
-@patch("read_data.get_token")
-def test_validate_required_files_fail_channel(mock_get_token, mock_get_config):
+@patch("read_data._load_config")
+@patch("read_data._load_yaml")
+def test_validate_required_files_fail_channel(mock_load_yaml, mock_load_config):
     """Test the validate files function"""
-    mock_get_token.side_effect = ["mock_bot", "mock_app", "mock_github"]
-    mock_get_config.side_effect = [
-        {"owner1": ["repo1"]},
-        {"mock_github": "mock_user"},
-        "",
-    ]
+    mock_load_yaml.return_value = MOCK_SECRETS
+    mock_load_config.return_value = {**MOCK_CONFIG_DATA, "channel": ""}
     with pytest.raises(ErrorInConfig):
         validate_required_files()